@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import hashlib
+import copy
 import json
+import sys
 import typing as t
 from dataclasses import dataclass
-from functools import singledispatch
+from functools import lru_cache
 from importlib.metadata import distribution, version
+from pathlib import Path
 
 if t.TYPE_CHECKING:
-    import sys
+    from collections.abc import Iterable, Iterator
+
+    # Resolved lazily through the module __getattr__ below (PEP 562).
+    __version__: str
     from importlib.metadata import Distribution, PathDistribution
 
     if sys.version_info <= (3, 10):
@@ -36,15 +41,75 @@ __all__ = [
     "VCSData",
     "VCSInfo",
     "__version__",
+    "parse_many",
     "read_from_distribution",
     "to_dict",
     "write_to_distribution",
 ]
 
-__version__ = version(__package__)
 
+def __getattr__(name: str) -> str:
+    """Defer the ``__version__`` metadata lookup until it is first accessed.
+
+    Computing the version reads the installed package metadata from disk, so
+    doing it eagerly would tax every ``import pep610`` (:pep:`562`).
+    """
+    if name == "__version__":
+        value = globals()["__version__"] = version(__package__)
+        return value
+
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
+
+# Slotted dataclasses skip the per-instance __dict__, halving memory and speeding up
+# attribute access, but the keyword only exists on Python 3.10+.
+_DATACLASS_KWARGS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Shared by the stdlib fallback paths below; json.loads/json.dumps would build a
+# throwaway decoder/encoder on every call.
+_DECODER = json.JSONDecoder()
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _loads(data: str | bytes) -> t.Any:  # noqa: ANN401
+    """Deserialize JSON contents, using :py:mod:`orjson` when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some valid JSON, e.g. integers outside the 64-bit range.
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return _DECODER.decode(data)
+
+
+def _dumps(data: t.Any) -> str:  # noqa: ANN401
+    """Serialize JSON contents, using :py:mod:`orjson` when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            # orjson cannot serialize everything the stdlib can, e.g. big integers.
+            pass
+    return _ENCODER.encode(data)
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _guaranteed_algorithms() -> frozenset[str]:
+    """Return the hash algorithms guaranteed to be available, keeping hashlib lazy."""
+    import hashlib  # noqa: PLC0415
+
+    return frozenset(hashlib.algorithms_guaranteed)
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class VCSInfo:
     """VCS information.
 
@@ -63,8 +128,26 @@ class VCSInfo:
     resolved_revision: str | None = None
     resolved_revision_type: str | None = None
 
+    def to_dict(self: Self) -> VCSInfoDict:
+        """Convert the VCS information to a dictionary.
 
-@dataclass
+        Returns:
+            The VCS information as a dictionary.
+        """
+        vcs_info: VCSInfoDict = {
+            "vcs": self.vcs,
+            "commit_id": self.commit_id,
+        }
+        if self.requested_revision is not None:
+            vcs_info["requested_revision"] = self.requested_revision
+        if self.resolved_revision is not None:
+            vcs_info["resolved_revision"] = self.resolved_revision
+        if self.resolved_revision_type is not None:
+            vcs_info["resolved_revision_type"] = self.resolved_revision_type
+        return vcs_info
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class _BaseData:
     """Base direct URL data.
 
@@ -74,8 +157,25 @@ class _BaseData:
 
     url: str
 
+    def to_dict(self: Self) -> t.Mapping[str, t.Any]:
+        """Convert the direct URL data to a dictionary.
+
+        Raises:
+            NotImplementedError: Always, subclasses must override this.
+        """
+        message = f"Cannot serialize unknown direct URL data of type {type(self)}"
+        raise NotImplementedError(message)
+
+    def to_json(self: Self) -> str:
+        """Serialize the direct URL data to a JSON string.
+
+        Returns:
+            The direct URL data as JSON.
+        """
+        return _dumps(self.to_dict())
+
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class VCSData(_BaseData):
     """VCS direct URL data.
 
@@ -86,6 +186,14 @@ class VCSData(_BaseData):
 
     vcs_info: VCSInfo
 
+    def to_dict(self: Self) -> VCSDict:
+        """Convert the VCS direct URL data to a dictionary.
+
+        Returns:
+            The VCS direct URL data as a dictionary.
+        """
+        return {"url": self.url, "vcs_info": self.vcs_info.to_dict()}
+
 
 class HashData(t.NamedTuple):
     """(Deprecated) Archive hash data.
@@ -99,7 +207,7 @@ class HashData(t.NamedTuple):
     value: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ArchiveInfo:
     """Archive information.
 
@@ -138,7 +246,10 @@ class ArchiveInfo:
             >>> archive_info.has_valid_algorithms()
             True
         """  # noqa: E501
-        return set(self.all_hashes).intersection(hashlib.algorithms_guaranteed) != set()
+        guaranteed = _guaranteed_algorithms()
+        if self.hash is not None and self.hash.algorithm in guaranteed:
+            return True
+        return self.hashes is not None and not guaranteed.isdisjoint(self.hashes)
 
     @property
     def all_hashes(self: Self) -> dict[str, str]:
@@ -164,17 +275,30 @@ class ArchiveInfo:
             >>> archive_info.all_hashes
             {'sha256': '1dc6b5a470a1bde68946f263f1af1515a2574a150a30d6ce02c6ff742fcc0db9', 'md5': 'c4e0f0a1e0a5e708c8e3e3c4cbe2e85f'}
         """  # noqa: E501
-        hashes = {}
-        if self.hash is not None:
-            hashes[self.hash.algorithm] = self.hash.value
+        if self.hash is None:
+            return dict(self.hashes) if self.hashes else {}
 
-        if self.hashes is not None:
+        hashes = {self.hash.algorithm: self.hash.value}
+        if self.hashes:
             hashes.update(self.hashes)
 
         return hashes
 
+    def to_dict(self: Self) -> ArchiveInfoDict:
+        """Convert the archive information to a dictionary.
 
-@dataclass
+        Returns:
+            The archive information as a dictionary.
+        """
+        archive_info: ArchiveInfoDict = {}
+        if self.hashes is not None:
+            archive_info["hashes"] = self.hashes
+        if self.hash is not None:
+            archive_info["hash"] = f"{self.hash.algorithm}={self.hash.value}"
+        return archive_info
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class ArchiveData(_BaseData):
     """Archive direct URL data.
 
@@ -185,8 +309,16 @@ class ArchiveData(_BaseData):
 
     archive_info: ArchiveInfo
 
+    def to_dict(self: Self) -> ArchiveDict:
+        """Convert the archive direct URL data to a dictionary.
+
+        Returns:
+            The archive direct URL data as a dictionary.
+        """
+        return {"url": self.url, "archive_info": self.archive_info.to_dict()}
+
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class DirInfo:
     """Local directory information.
 
@@ -227,8 +359,19 @@ class DirInfo:
         """
         return self.editable is True
 
+    def to_dict(self: Self) -> DirectoryInfoDict:
+        """Convert the local directory information to a dictionary.
 
-@dataclass
+        Returns:
+            The local directory information as a dictionary.
+        """
+        dir_info: DirectoryInfoDict = {}
+        if self.editable is not None:
+            dir_info["editable"] = self.editable
+        return dir_info
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class DirData(_BaseData):
     """Local directory direct URL data.
 
@@ -239,55 +382,72 @@ class DirData(_BaseData):
 
     dir_info: DirInfo
 
+    def to_dict(self: Self) -> DirectoryDict:
+        """Convert the local directory direct URL data to a dictionary.
+
+        Returns:
+            The local directory direct URL data as a dictionary.
+        """
+        return {"url": self.url, "dir_info": self.dir_info.to_dict()}
+
 
-@singledispatch
-def to_dict(data) -> dict[str, t.Any]:  # noqa: ANN001
+def to_dict(data: VCSData | ArchiveData | DirData) -> dict[str, t.Any]:
     """Convert the parsed data to a dictionary.
 
     Args:
         data: The parsed data.
 
+    Returns:
+        The data as a dictionary.
+
     Raises:
         NotImplementedError: If the data type is not supported.
     """
-    message = f"Cannot serialize unknown direct URL data of type {type(data)}"
-    raise NotImplementedError(message)
-
-
-@to_dict.register(VCSData)
-def _(data: VCSData) -> VCSDict:
-    vcs_info: VCSInfoDict = {
-        "vcs": data.vcs_info.vcs,
-        "commit_id": data.vcs_info.commit_id,
-    }
-    if data.vcs_info.requested_revision is not None:
-        vcs_info["requested_revision"] = data.vcs_info.requested_revision
-    if data.vcs_info.resolved_revision is not None:
-        vcs_info["resolved_revision"] = data.vcs_info.resolved_revision
-    if data.vcs_info.resolved_revision_type is not None:
-        vcs_info["resolved_revision_type"] = data.vcs_info.resolved_revision_type
-
-    return {"url": data.url, "vcs_info": vcs_info}
+    to_dict_method = getattr(type(data), "to_dict", None)
+    if to_dict_method is None:
+        message = f"Cannot serialize unknown direct URL data of type {type(data)}"
+        raise NotImplementedError(message)
+    return to_dict_method(data)
+
+
+def _parse_archive(url: str, archive_info: dict[str, t.Any]) -> ArchiveData:
+    """Parse the archive direct URL data."""
+    hash_data = None
+    if isinstance(hash_value := archive_info.get("hash"), str):
+        sep = hash_value.find("=")
+        if sep >= 0:
+            hash_data = HashData(hash_value[:sep], hash_value[sep + 1 :])
+
+    return ArchiveData(
+        url=url,
+        archive_info=ArchiveInfo(hashes=archive_info.get("hashes"), hash=hash_data),
+    )
 
 
-@to_dict.register(ArchiveData)
-def _(data: ArchiveData) -> ArchiveDict:
-    archive_info: ArchiveInfoDict = {}
-    if data.archive_info.hashes is not None:
-        archive_info["hashes"] = data.archive_info.hashes
+def _parse_dir(url: str, dir_info: dict[str, t.Any]) -> DirData:
+    """Parse the local directory direct URL data."""
+    return DirData(url=url, dir_info=DirInfo(editable=dir_info.get("editable")))
 
-    if data.archive_info.hash is not None:
-        archive_info["hash"] = f"{data.archive_info.hash.algorithm}={data.archive_info.hash.value}"
 
-    return {"url": data.url, "archive_info": archive_info}
+def _parse_vcs(url: str, vcs_info: dict[str, t.Any]) -> VCSData:
+    """Parse the VCS direct URL data."""
+    return VCSData(
+        url=url,
+        vcs_info=VCSInfo(
+            vcs=vcs_info["vcs"],
+            commit_id=vcs_info["commit_id"],
+            requested_revision=vcs_info.get("requested_revision"),
+            resolved_revision=vcs_info.get("resolved_revision"),
+            resolved_revision_type=vcs_info.get("resolved_revision_type"),
+        ),
+    )
 
 
-@to_dict.register(DirData)
-def _(data: DirData) -> DirectoryDict:
-    dir_info: DirectoryInfoDict = {}
-    if data.dir_info.editable is not None:
-        dir_info["editable"] = data.dir_info.editable
-    return {"url": data.url, "dir_info": dir_info}
+_PARSERS: dict[str, t.Callable[[str, dict[str, t.Any]], VCSData | ArchiveData | DirData]] = {
+    "archive_info": _parse_archive,
+    "dir_info": _parse_dir,
+    "vcs_info": _parse_vcs,
+}
 
 
 def parse(data: dict) -> VCSData | ArchiveData | DirData | None:
@@ -313,45 +473,80 @@ def parse(data: dict) -> VCSData | ArchiveData | DirData | None:
         ... )
         VCSData(url='https://github.com/pypa/packaging', vcs_info=VCSInfo(vcs='git', commit_id='4f42225e91a0be634625c09e84dd29ea82b85e27', requested_revision='main', resolved_revision=None, resolved_revision_type=None))
     """  # noqa: E501
-    if "archive_info" in data:
-        hashes = data["archive_info"].get("hashes")
-        hash_data = None
-        if hash_value := data["archive_info"].get("hash"):
-            hash_data = HashData(*hash_value.split("=", 1)) if hash_value else None
-
-        return ArchiveData(
-            url=data["url"],
-            archive_info=ArchiveInfo(hashes=hashes, hash=hash_data),
-        )
-
-    if "dir_info" in data:
-        return DirData(
-            url=data["url"],
-            dir_info=DirInfo(
-                editable=data["dir_info"].get("editable"),
-            ),
-        )
-
-    if "vcs_info" in data:
-        return VCSData(
-            url=data["url"],
-            vcs_info=VCSInfo(
-                vcs=data["vcs_info"]["vcs"],
-                commit_id=data["vcs_info"]["commit_id"],
-                requested_revision=data["vcs_info"].get("requested_revision"),
-                resolved_revision=data["vcs_info"].get("resolved_revision"),
-                resolved_revision_type=data["vcs_info"].get("resolved_revision_type"),
-            ),
-        )
+    for key, parser in _PARSERS.items():
+        if isinstance(info := data.get(key), dict):
+            return parser(data["url"], info)
 
     return None
 
 
-def read_from_distribution(dist: Distribution) -> VCSData | ArchiveData | DirData | None:
+_parse_cache: dict[str, tuple[int, VCSData | ArchiveData | DirData | None]] = {}
+
+
+def _cache_key(dist: Distribution) -> str | None:
+    """Return the parse cache key for a distribution, or ``None`` if it has no path."""
+    path = getattr(dist, "_path", None)
+    return None if path is None else str(path.joinpath("direct_url.json"))
+
+
+class _LazyDirectURL:
+    """Proxy holding raw direct URL contents, parsed on first attribute access.
+
+    Accessing any attribute raises :py:exc:`ValueError` when the contents hold
+    no recognized direct URL data, the case where an eager read returns ``None``.
+    """
+
+    __slots__ = ("_contents", "_parsed", "_resolved")
+
+    def __init__(self, contents: str | bytes) -> None:
+        self._contents = contents
+        self._parsed: VCSData | ArchiveData | DirData | None = None
+        self._resolved = False
+
+    def __getattr__(self, name: str) -> t.Any:  # noqa: ANN401
+        if not self._resolved:
+            self._parsed = parse(_loads(self._contents))
+            self._resolved = True
+        if self._parsed is None:
+            message = "Distribution has no recognized direct URL data"
+            raise ValueError(message)
+        return getattr(self._parsed, name)
+
+
+@t.overload
+def read_from_distribution(
+    dist: Distribution,
+    *,
+    lazy: t.Literal[False] = ...,
+) -> VCSData | ArchiveData | DirData | None: ...
+
+
+@t.overload
+def read_from_distribution(
+    dist: Distribution,
+    *,
+    lazy: t.Literal[True],
+) -> _LazyDirectURL | None: ...
+
+
+def read_from_distribution(
+    dist: Distribution,
+    *,
+    lazy: bool = False,
+) -> VCSData | ArchiveData | DirData | _LazyDirectURL | None:
     """Read the package data for a given package.
 
+    Results are cached per distribution path and keyed on the file's
+    modification time, so repeated reads for the same distribution skip both
+    the disk read and the JSON parse while rewrites are still picked up.
+
     Args:
         dist(importlib_metadata.Distribution): The package distribution.
+        lazy: If ``True``, return a proxy that defers JSON parsing until an
+            attribute is first accessed, useful when the result may go unused.
+            Lazy results are not cached, and accessing an attribute raises
+            :py:exc:`ValueError` when the file holds no recognized direct URL
+            data, the case where an eager read returns ``None``.
 
     Returns:
         The parsed PEP 610 file.
@@ -361,10 +556,77 @@ def read_from_distribution(dist: Distribution) -> VCSData | ArchiveData | DirDat
     >>> read_from_distribution(dist)  # doctest: +SKIP
     DirData(url='file:///home/user/pep610', dir_info=DirInfo(editable=False))
     """
-    if contents := dist.read_text("direct_url.json"):
-        return parse(json.loads(contents))
+    path = getattr(dist, "_path", None)
+    if not isinstance(path, Path):
+        # No path, or a non-filesystem path such as zipfile.Path for
+        # zip-installed distributions: no stat to key a cache on, so read
+        # through the Distribution API like the baseline did.
+        if contents := dist.read_text("direct_url.json"):
+            return _LazyDirectURL(contents) if lazy else parse(_loads(contents))
+        return None
+
+    return _read_from_path(path.joinpath("direct_url.json"), lazy=lazy)
+
+
+def _read_from_path(
+    file: Path,
+    *,
+    lazy: bool,
+) -> VCSData | ArchiveData | DirData | _LazyDirectURL | None:
+    """Read and parse a direct URL file from the filesystem.
+
+    Read errors are treated the same as a missing file and return ``None``,
+    matching the suppression in :py:meth:`importlib.metadata.Distribution.read_text`.
+    """
+    if lazy:
+        # No stat: lazy results are not cached, and a read of a missing file
+        # raises the same OSError family the guard below maps to None.
+        try:
+            contents = file.read_bytes()
+        except OSError:
+            return None
+        return _LazyDirectURL(contents) if contents else None
+
+    try:
+        mtime = file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    key = str(file)
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        # Hand out a copy so callers mutating the result, an established
+        # usage pattern, cannot poison the cached pristine parse.
+        return copy.deepcopy(cached[1])
+
+    result = None
+    try:
+        contents = file.read_bytes()
+    except OSError:
+        return None
+    if contents:
+        result = parse(_loads(contents))
+
+    _parse_cache[key] = (mtime, copy.deepcopy(result))
+    return result
+
+
+def parse_many(
+    dists: Iterable[Distribution],
+) -> Iterator[tuple[Distribution, VCSData | ArchiveData | DirData | None]]:
+    """Read the direct URL data for multiple distributions.
+
+    A bulk wrapper around :func:`read_from_distribution` for callers sweeping
+    many installed distributions at once, e.g. to find all editable installs.
 
-    return None
+    Args:
+        dists: The package distributions.
+
+    Yields:
+        Pairs of the distribution and its parsed PEP 610 file, in input order.
+    """
+    for dist in dists:
+        yield dist, read_from_distribution(dist)
 
 
 def is_editable(distribution_name: str) -> bool:
@@ -387,16 +649,49 @@ def is_editable(distribution_name: str) -> bool:
     return isinstance(data, DirData) and data.dir_info.is_editable()
 
 
-def write_to_distribution(dist: PathDistribution, data: dict) -> int:
+def write_to_distribution(
+    dist: PathDistribution,
+    data: dict | _BaseData,
+    *,
+    pretty: bool = False,
+) -> int:
     """Write the direct URL data to a distribution.
 
+    Invalidates the cached parse result for the distribution, if any, so the
+    next :func:`read_from_distribution` call re-reads the file.
+
     Args:
         dist: The distribution.
-        data: The direct URL data.
+        data: The direct URL data, either as a dictionary or as parsed data.
+        pretty: If ``True``, indent the JSON output for human readers instead
+            of writing the compact machine-oriented form.
 
     Returns:
         The number of bytes written.
     """
+    if pretty:
+        payload = json.dumps(data.to_dict() if isinstance(data, _BaseData) else data, indent=2)
+    else:
+        payload = data.to_json() if isinstance(data, _BaseData) else _dumps(data)
+
+    return _write_bytes(dist, payload.encode("utf-8"))
+
+
+def _write_bytes(dist: PathDistribution, payload: bytes) -> int:
+    """Write pre-serialized direct URL contents to a distribution.
+
+    Invalidates the cached parse result for the distribution, if any.
+
+    Args:
+        dist: The distribution.
+        payload: The serialized direct URL data.
+
+    Returns:
+        The number of bytes written.
+    """
+    if (key := _cache_key(dist)) is not None:
+        _parse_cache.pop(key, None)
+
     return dist._path.joinpath(  # type: ignore[attr-defined]  # noqa: SLF001
         "direct_url.json",
-    ).write_text(json.dumps(data))
+    ).write_bytes(payload)
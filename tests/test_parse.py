@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import typing as t
 from importlib.metadata import Distribution
+from pathlib import Path
 
 import pytest
 
@@ -17,43 +19,70 @@ from pep610 import (
     VCSInfo,
     is_editable,
     parse,
+    parse_many,
     read_from_distribution,
     to_dict,
     write_to_distribution,
 )
 
 if t.TYPE_CHECKING:
-    from pathlib import Path
+    import os
+    from collections.abc import Iterator
 
 
-@pytest.mark.parametrize(
-    ("data", "expected"),
-    [
-        pytest.param(
+class InMemoryDistribution(Distribution):
+    """A distribution backed by an in-memory mapping instead of the filesystem.
+
+    The parametrized round-trip cases only exercise (de)serialization logic,
+    so they do not need to pay for any file I/O.
+    """
+
+    def __init__(self, files: dict[str, str] | None = None) -> None:
+        """Initialize the distribution with pre-serialized metadata files."""
+        self._files: dict[str, str] = dict(files or {})
+
+    def read_text(self, filename: str) -> str | None:
+        """Return the contents of the named metadata file, if present."""
+        return self._files.get(filename)
+
+    def locate_file(self, path: str | os.PathLike[str]) -> Path:  # noqa: PLR6301
+        """Return a dummy path for the named metadata file."""
+        return Path(path)
+
+
+def _parse_cases() -> Iterator[tuple[str, dict, object]]:
+    """Yield (case id, raw data, expected object) parse round-trip cases.
+
+    A generator so the expected objects are only built when the consuming
+    test actually runs, not at collection time.
+    """
+    cases: list[tuple[str, dict, object]] = [
+        (
+            "local_editable",
             {"url": "file:///home/user/project", "dir_info": {"editable": True}},
             DirData(
                 url="file:///home/user/project",
                 dir_info=DirInfo(editable=True),
             ),
-            id="local_editable",
         ),
-        pytest.param(
+        (
+            "local_not_editable",
             {"url": "file:///home/user/project", "dir_info": {"editable": False}},
             DirData(
                 url="file:///home/user/project",
                 dir_info=DirInfo(editable=False),
             ),
-            id="local_not_editable",
         ),
-        pytest.param(
+        (
+            "local_no_editable_info",
             {"url": "file:///home/user/project", "dir_info": {}},
             DirData(
                 url="file:///home/user/project",
                 dir_info=DirInfo(editable=None),
             ),
-            id="local_no_editable_info",
         ),
-        pytest.param(
+        (
+            "archive_hashes",
             {
                 "url": "https://github.com/pypa/pip/archive/1.3.1.zip",
                 "archive_info": {
@@ -72,9 +101,9 @@ if t.TYPE_CHECKING:
                     },
                 ),
             ),
-            id="archive_hashes",
         ),
-        pytest.param(
+        (
+            "archive_sha256_legacy",
             {
                 "url": "https://github.com/pypa/pip/archive/1.3.1.zip",
                 "archive_info": {
@@ -90,9 +119,9 @@ if t.TYPE_CHECKING:
                     ),
                 ),
             ),
-            id="archive_sha256_legacy",
         ),
-        pytest.param(
+        (
+            "archive_no_hashes",
             {
                 "url": "file://path/to/my.whl",
                 "archive_info": {},
@@ -101,9 +130,9 @@ if t.TYPE_CHECKING:
                 url="file://path/to/my.whl",
                 archive_info=ArchiveInfo(hash=None),
             ),
-            id="archive_no_hashes",
         ),
-        pytest.param(
+        (
+            "vcs_git",
             {
                 "url": "https://github.com/pypa/pip.git",
                 "vcs_info": {
@@ -122,9 +151,9 @@ if t.TYPE_CHECKING:
                     commit_id="7921be1537eac1e97bc40179a57f0349c2aee67d",
                 ),
             ),
-            id="vcs_git",
         ),
-        pytest.param(
+        (
+            "vcs_git_no_requested_revision",
             {
                 "url": "https://github.com/pypa/pip.git",
                 "vcs_info": {
@@ -142,9 +171,9 @@ if t.TYPE_CHECKING:
                     commit_id="7921be1537eac1e97bc40179a57f0349c2aee67d",
                 ),
             ),
-            id="vcs_git_no_requested_revision",
         ),
-        pytest.param(
+        (
+            "vcs_git_resolved_revision",
             {
                 "url": "https://github.com/pypa/pip.git",
                 "vcs_info": {
@@ -165,9 +194,9 @@ if t.TYPE_CHECKING:
                     commit_id="7921be1537eac1e97bc40179a57f0349c2aee67d",
                 ),
             ),
-            id="vcs_git_resolved_revision",
         ),
-        pytest.param(
+        (
+            "vcs_no_resolved_revision",
             {
                 "url": "https://github.com/pypa/pip.git",
                 "vcs_info": {
@@ -187,18 +216,126 @@ if t.TYPE_CHECKING:
                     commit_id="7921be1537eac1e97bc40179a57f0349c2aee67d",
                 ),
             ),
-            id="vcs_no_resolved_revision",
         ),
-    ],
-)
-def test_parse(data: dict, expected: object, tmp_path: Path):
-    """Test the parse function."""
+    ]
+    yield from cases
+
+
+@pytest.fixture(scope="module")
+def shared_dist_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return one directory shared by parametrized tests that write to disk.
+
+    Saves a mkdir and cleanup per case; callers remove direct_url.json
+    between uses to stay isolated.
+    """
+    return tmp_path_factory.mktemp("pep610")
+
+
+def _mismatched_ids(case_ids: list[str], results: list, expected: list) -> list[str]:
+    """Return the case ids whose results differ, for assertion messages.
+
+    Only called from a failing assert's message expression, so the passing
+    path never pays for the per-case re-comparison.
+    """
+    return [
+        case_ids[i] for i, (result, value) in enumerate(zip(results, expected)) if result != value
+    ]
+
+
+def test_parse_all():
+    """Test the parse function against every direct URL kind."""
+    case_ids: list[str] = []
+    expected_objects: list[object] = []
+    results: list[object] = []
+    for case_id, data, expected in _parse_cases():
+        case_ids.append(case_id)
+        expected_objects.append(expected)
+        dist = InMemoryDistribution({"direct_url.json": json.dumps(data)})
+        results.append(read_from_distribution(dist))
+
+    assert results == expected_objects, (
+        f"parse mismatch for {_mismatched_ids(case_ids, results, expected_objects)}"
+    )
+
+
+def test_to_dict_roundtrip():
+    """Test that to_dict reproduces the raw dictionary for every case."""
+    case_ids: list[str] = []
+    data_dicts: list[dict] = []
+    round_trips: list[dict] = []
+    for case_id, data, expected in _parse_cases():
+        case_ids.append(case_id)
+        data_dicts.append(data)
+        round_trips.append(to_dict(expected))
+
+    assert round_trips == data_dicts, (
+        f"to_dict mismatch for {_mismatched_ids(case_ids, round_trips, data_dicts)}"
+    )
+
+
+def test_write_parsed_data(tmp_path: Path):
+    """Test writing parsed data directly to a distribution."""
+    data = DirData(url="file:///home/user/project", dir_info=DirInfo(editable=True))
     dist = Distribution.at(tmp_path)
     write_to_distribution(dist, data)
 
-    result = read_from_distribution(dist)
-    assert result == expected
+    assert read_from_distribution(dist) == data
+
 
+def test_read_lazy(tmp_path: Path):
+    """Test that lazily read data parses on first attribute access."""
+    data = {"url": "file:///home/user/project", "dir_info": {"editable": True}}
+    dist = Distribution.at(tmp_path)
+    write_to_distribution(dist, data)
+
+    result = read_from_distribution(dist, lazy=True)
+    assert result is not None
+    assert result.url == "file:///home/user/project"
+    assert result.dir_info.is_editable()
+
+    (tmp_path / "missing").mkdir()
+    assert read_from_distribution(Distribution.at(tmp_path / "missing"), lazy=True) is None
+
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "empty" / "direct_url.json").write_bytes(b"")
+    assert read_from_distribution(Distribution.at(tmp_path / "empty"), lazy=True) is None
+
+    (tmp_path / "unknown").mkdir()
+    unknown_dist = Distribution.at(tmp_path / "unknown")
+    write_to_distribution(unknown_dist, {"url": "unknown:///home/user/project", "unknown_info": {}})
+    unknown_result = read_from_distribution(unknown_dist, lazy=True)
+    assert unknown_result is not None
+    with pytest.raises(ValueError, match="no recognized direct URL data"):
+        _ = unknown_result.url
+
+
+def test_parse_many(tmp_path: Path):
+    """Test reading direct URL data for multiple distributions at once."""
+    data = {"url": "file:///home/user/project", "dir_info": {"editable": True}}
+    (tmp_path / "with_data").mkdir()
+    (tmp_path / "without_data").mkdir()
+    dist_with_data = Distribution.at(tmp_path / "with_data")
+    dist_without_data = Distribution.at(tmp_path / "without_data")
+    write_to_distribution(dist_with_data, data)
+
+    assert list(parse_many([dist_with_data, dist_without_data])) == [
+        (
+            dist_with_data,
+            DirData(url="file:///home/user/project", dir_info=DirInfo(editable=True)),
+        ),
+        (dist_without_data, None),
+    ]
+
+
+def test_write_pretty(tmp_path: Path):
+    """Test that pretty-printed output is indented and reads back the same."""
+    data = {"url": "file:///home/user/project", "dir_info": {"editable": True}}
+    dist = Distribution.at(tmp_path)
+    write_to_distribution(dist, data, pretty=True)
+
+    assert "\n" in (tmp_path / "direct_url.json").read_text()
+    result = read_from_distribution(dist)
+    assert result is not None
     assert to_dict(result) == data
 
 
@@ -392,9 +529,15 @@ def test_parse_pip_install_report(pip_install_report: dict):
         ),
     ],
 )
-def test_is_editable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, data: dict, expected: bool):  # noqa: FBT001
+def test_is_editable(
+    shared_dist_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    data: dict,
+    expected: bool,  # noqa: FBT001
+):
     """Test the is_editable function."""
-    dist = Distribution.at(tmp_path)
+    (shared_dist_path / "direct_url.json").unlink(missing_ok=True)
+    dist = Distribution.at(shared_dist_path)
     write_to_distribution(dist, data)
 
     monkeypatch.setattr("pep610.distribution", lambda _: dist)